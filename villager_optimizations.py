@@ -38,6 +38,11 @@ Notes:
 - Unknown keys in named_villagers.json are ignored (never fatal).
 - We DO NOT "strip roman numerals" globally because that can corrupt levels (Sharpness II vs Sharpness V).
 - We DO apply safe aliases for single-level enchants + common “I” formatting (Mending I -> Mending, etc.).
+- `--mode greedy` swaps the exact search for an iteratively reweighted greedy cover (8 rounds; always fast,
+  may use extra villagers).
+- Pure standard library (orjson is used for parsing if installed). The set-cover search is tight
+  integer/bitmask code, so on large villager sets it runs much faster under PyPy:
+  `pypy3 villager_optimizations.py named_villagers.json`.
 """
 
 from __future__ import annotations
@@ -45,9 +50,18 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from array import array
 from pathlib import Path
 from collections import defaultdict
-from typing import Dict, Any, List, Tuple, Set, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Any, List, Tuple, Set, FrozenSet, Optional, Sequence
+
+try:
+    import orjson  # optional: faster JSON parsing, stdlib json is the fallback
+except ImportError:
+    orjson = None
 
 
 # -----------------------------
@@ -68,45 +82,62 @@ ALIASES = {
 }
 
 
+@lru_cache(maxsize=4096)
 def normalize_key(key: str) -> str:
+    # Keys repeat heavily across villagers, so cache instead of re-stripping every time.
+    # Interned so lookups against the (also interned) master names compare by pointer.
     key = key.strip()
-    return ALIASES.get(key, key)
+    return sys.intern(ALIASES.get(key, key))
 
 
 # -----------------------------
-# Price handling
+# Popcount
 # -----------------------------
 
-def current_price_for(villagers: Dict[str, Any], villager_name: str, enchantment: str) -> Optional[int]:
-    """
-    Returns the effective price for a villager's enchantment entry.
+# int.bit_count() is Python 3.10+; older CPython/PyPy get a 16-bit lookup table instead of bin(x).count("1").
+try:
+    _popcount = int.bit_count
+except AttributeError:
+    _POPCOUNT16 = bytes(bin(i).count("1") for i in range(1 << 16))
 
-    Supports:
-      - int
-      - {"pre": int|'X'|None, "post": int|'X'|None}
+    def _popcount(x: int) -> int:
+        n = 0
+        while x:
+            n += _POPCOUNT16[x & 0xFFFF]
+            x >>= 16
+        return n
 
-    If villager has "cured": true, uses "post", else "pre".
-    Returns None if no usable price exists.
+
+# -----------------------------
+# Price handling
+# -----------------------------
+
+def normalized_enchantments(ench_dict: Dict[str, Any]) -> Dict[str, Any]:
     """
-    ench_dict = villagers[villager_name].get("enchantments", {})
-    raw = ench_dict.get(enchantment)
+    Re-keys a villager's enchantments dict by normalize_key().
 
-    # Try alias lookup if not found
-    if raw is None:
-        # if stored as e.g. "Mending I" but requested as "Mending" etc.
-        for k, v in ench_dict.items():
-            if normalize_key(k) == enchantment:
-                raw = v
-                break
+    When several keys normalize to the same name, an exact non-null key wins ("Mending" over
+    "Mending I"); otherwise the first key in file order wins.
+    """
+    norm: Dict[str, Any] = {}
+    for k, v in ench_dict.items():
+        norm.setdefault(normalize_key(k), v)
+    for n in norm:
+        exact = ench_dict.get(n)
+        if exact is not None:
+            norm[n] = exact
+    return norm
 
-    if raw is None:
-        return None
 
+def resolve_price(raw: Any, cured: bool) -> Optional[int]:
+    """
+    Resolves a raw enchantment entry (int or {"pre", "post"}) to its effective price.
+    Returns None if no usable price exists.
+    """
     if isinstance(raw, int):
         return raw
 
     if isinstance(raw, dict):
-        cured = bool(villagers[villager_name].get("cured"))
         val = raw.get("post" if cured else "pre")
         if val in (None, "X"):
             return None
@@ -118,13 +149,35 @@ def current_price_for(villagers: Dict[str, Any], villager_name: str, enchantment
     return None
 
 
+def villager_cost1_mask(data: Dict[str, Any], req_index: Dict[str, int]) -> int:
+    """
+    Single pass over one villager's resolved prices (data["_prices"], set by load_villagers).
+    Returns the bitmask (per req_index) of required enchants offered at cost==1.
+    """
+    mask = 0
+    for e, price in data["_prices"].items():
+        if price == 1:
+            idx = req_index.get(e)
+            if idx is not None:
+                mask |= 1 << idx
+    return mask
+
+
 # -----------------------------
 # Loading
 # -----------------------------
 
 def load_json(path: Path) -> Any:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # raw bytes: orjson parses them directly, and json.loads decodes UTF-8 itself
+    with open(path, "rb") as f:
+        raw = f.read()
+    try:
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
+    except ValueError as e:
+        # decode errors only give a position; say which file it was
+        raise ValueError(f"{path}: {e}") from e
 
 
 def load_master_enchantments(enchantments_path: Path) -> Tuple[List[str], List[str]]:
@@ -149,7 +202,7 @@ def load_master_enchantments(enchantments_path: Path) -> Tuple[List[str], List[s
         name = entry.get("name")
         if not isinstance(name, str) or not name.strip():
             raise ValueError("Each enchantment entry must have a non-empty string 'name'.")
-        name = name.strip()
+        name = sys.intern(name.strip())
         if name in seen:
             raise ValueError(f"Duplicate enchantment in master list: '{name}'")
         seen.add(name)
@@ -160,67 +213,349 @@ def load_master_enchantments(enchantments_path: Path) -> Tuple[List[str], List[s
         non_raw = []
     if not isinstance(non_raw, list) or not all(isinstance(x, str) for x in non_raw):
         raise ValueError("'non_enchantments' must be a list of strings if present.")
-    non_enchants = [x.strip() for x in non_raw if x.strip()]
+    non_enchants = [sys.intern(x.strip()) for x in non_raw if x.strip()]
 
     return required, non_enchants
 
 
 def load_villagers(villagers_path: Path) -> Dict[str, Any]:
-    villagers = load_json(villagers_path)
-    if not isinstance(villagers, dict):
+    """
+    Loads and lightly validates the villagers file.
+
+    Each villager dict gets derived keys added:
+      _norm_keys: frozenset of the enchantment keys re-keyed by normalize_key() (see normalized_enchantments)
+      _prices: normalized key -> effective price (resolve_price with this villager's cured flag) or None
+    """
+    raw = load_json(villagers_path)
+    if not isinstance(raw, dict):
         raise ValueError("Villagers file must be a JSON object keyed by villager name.")
     # light validation
-    for v_name, data in villagers.items():
+    villagers: Dict[str, Any] = {}
+    for v_name, data in raw.items():
         if not isinstance(data, dict):
             raise ValueError(f"Villager '{v_name}' must be an object.")
         ench = data.get("enchantments", {})
         if not isinstance(ench, dict):
             raise ValueError(f"Villager '{v_name}': 'enchantments' must be an object.")
+        norm = normalized_enchantments(ench)
+        data["_norm_keys"] = frozenset(norm)
+        cured = bool(data.get("cured"))
+        data["_prices"] = {e: resolve_price(raw, cured) for e, raw in norm.items()}
+        villagers[sys.intern(v_name)] = data
     return villagers
 
 
-def warn_unknown_keys(villagers: Dict[str, Any], required_set: Set[str], non_set: Set[str], warn_limit: int = 40) -> None:
-    allowed = required_set | non_set
+def warn_unknown_keys(villagers: Dict[str, Any], allowed: FrozenSet[str], warn_limit: int = 40) -> None:
+    """
+    allowed: every master name (goal enchantments + non-enchantments), e.g. frozenset(chain(required, non_enchants))
+    """
+    if not villagers:
+        return
     unknown: List[Tuple[str, str]] = []
+    overflow = 0  # unknown entries past warn_limit: counted, never formatted
     for v_name, data in villagers.items():
-        for k in data.get("enchantments", {}).keys():
-            kk = normalize_key(k)
-            if kk not in allowed:
-                unknown.append((v_name, k))
+        # one C-level set difference per villager; most villagers have nothing unknown
+        bad = data["_norm_keys"] - allowed
+        if not bad:
+            continue
+        # report the original spelling, in file order
+        hits = [k for k in data.get("enchantments", {}) if normalize_key(k) in bad]
+        room = warn_limit - len(unknown)
+        if room > 0:
+            unknown.extend((v_name, k) for k in hits[:room])
+        overflow += max(0, len(hits) - max(room, 0))
     if unknown:
-        print("ℹ️ Ignoring non-master entries found in villagers file (not used for optimization):")
-        for v, k in unknown[:warn_limit]:
-            print(f"  - {v}: '{k}'")
-        if len(unknown) > warn_limit:
-            print(f"  ... and {len(unknown) - warn_limit} more")
+        out = ["ℹ️ Ignoring non-master entries found in villagers file (not used for optimization):"]
+        out.extend(f"  - {v}: '{k}'" for v, k in unknown)
+        if overflow:
+            out.append(f"  ... and {overflow} more")
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 # -----------------------------
 # Cost==1 masks
 # -----------------------------
 
-def build_cost1_masks(villagers: Dict[str, Any], required: List[str]) -> Tuple[List[str], Dict[str, int], List[Tuple[str, int]], int]:
+@dataclass
+class Cost1Index:
     """
-    Returns:
+    Everything derived from (villagers, required) for cost==1 coverage; built once by build_cost1_masks
+    and shared by the solvers and the report.
+
       req_list: sorted required enchantments
       req_index: mapping enchant -> bit index
       villager_masks: list of (villager_name, mask) where mask is for cost==1 covered enchants
       full_mask: all required bits set
+      cost1_map: villager_name -> cost==1 required enchants (in req_list order), for every villager,
+                 inserted in case-insensitive name order so callers can iterate it instead of re-sorting
     """
+    req_list: List[str]
+    req_index: Dict[str, int]
+    villager_masks: List[Tuple[str, int]]
+    full_mask: int
+    cost1_map: Dict[str, List[str]]
+
+
+def build_cost1_masks(villagers: Dict[str, Any], required: List[str]) -> Cost1Index:
     req_list = sorted(required, key=str.lower)
     req_index = {e: i for i, e in enumerate(req_list)}
     full_mask = (1 << len(req_list)) - 1
 
     villager_masks: List[Tuple[str, int]] = []
+    cost1_map: Dict[str, List[str]] = {}
+    # the only villager-name sort; cost1_map keeps this order for reporting
     for v_name in sorted(villagers.keys(), key=str.lower):
-        mask = 0
-        for e in req_list:
-            if current_price_for(villagers, v_name, e) == 1:
-                mask |= (1 << req_index[e])
+        data = villagers[v_name]
+        mask = villager_cost1_mask(data, req_index)
+
+        # bits ascend in req_list order, so this is already sorted
+        cost1: List[str] = []
+        mm = mask
+        while mm:
+            lsb = mm & -mm
+            cost1.append(req_list[lsb.bit_length() - 1])
+            mm -= lsb
+        cost1_map[v_name] = cost1
         if mask:
             villager_masks.append((v_name, mask))
 
-    return req_list, req_index, villager_masks, full_mask
+    return Cost1Index(req_list, req_index, villager_masks, full_mask, cost1_map)
+
+
+def prune_dominated_masks(villager_masks: List[Tuple[str, int]]) -> List[Tuple[str, int]]:
+    """
+    Drops villagers that can never be needed in a minimum cover:
+      - identical masks: only the first (by input order) is kept
+      - strict subsets of another villager's mask
+
+    Any cover using a dropped villager stays a cover (of the same size) with its dominator swapped in.
+    Returns the survivors in their original order.
+    """
+    by_mask: Dict[int, str] = {}
+    for name, m in villager_masks:
+        by_mask.setdefault(m, name)
+
+    kept: List[int] = []
+    for m in sorted(by_mask, key=_popcount, reverse=True):
+        if not any(m & k == m for k in kept):
+            kept.append(m)
+
+    kept_names = {by_mask[m] for m in kept}
+    return [(name, m) for name, m in villager_masks if name in kept_names]
+
+
+def build_bit_to_items(masks: Sequence[int]) -> Dict[int, List[int]]:
+    """
+    Inverted index: bit -> indices (into masks, ascending) of every mask that has that bit set.
+    """
+    bit_to_items: Dict[int, List[int]] = defaultdict(list)
+    for i, m in enumerate(masks):
+        mm = m
+        while mm:
+            lsb = mm & -mm
+            b = lsb.bit_length() - 1
+            bit_to_items[b].append(i)
+            mm -= lsb
+    return bit_to_items
+
+
+def split_forced_villagers(
+    villager_masks: List[Tuple[str, int]], target_mask: int
+) -> Tuple[List[str], int, List[Tuple[str, int]]]:
+    """
+    A villager that is the only cost==1 source of some target bit is in every cover.
+
+    Returns:
+      forced: names of those villagers (input order)
+      precover: OR of their masks
+      residual: the other villagers, still useful for target_mask & ~precover
+    """
+    bit_to_items = build_bit_to_items([m for _, m in villager_masks])
+
+    forced_idx: Set[int] = set()
+    mm = target_mask
+    while mm:
+        lsb = mm & -mm
+        holders = bit_to_items.get(lsb.bit_length() - 1, [])
+        if len(holders) == 1:
+            forced_idx.add(holders[0])
+        mm -= lsb
+
+    forced: List[str] = []
+    precover = 0
+    for i in sorted(forced_idx):
+        name, m = villager_masks[i]
+        forced.append(name)
+        precover |= m
+
+    left = target_mask & ~precover
+    residual = [(name, m) for i, (name, m) in enumerate(villager_masks) if i not in forced_idx and m & left]
+    return forced, precover, residual
+
+
+def compact_masks(villager_masks: List[Tuple[str, int]], target_mask: int) -> Tuple[List[Tuple[str, int]], int]:
+    """
+    Renumbers the bits of target_mask to 0..k-1 and drops every other bit from the masks.
+
+    The solver only ever looks at target bits, and after forced villagers are taken out the residual
+    target is usually a handful of bits; compacted masks then fit in one 30-bit CPython int digit,
+    which keeps & and popcount on the small-int fast path.
+    Returns (compacted villager_masks, (1 << k) - 1).
+    """
+    positions: List[int] = []
+    mm = target_mask
+    while mm:
+        lsb = mm & -mm
+        positions.append(lsb)
+        mm -= lsb
+
+    out: List[Tuple[str, int]] = []
+    for name, m in villager_masks:
+        cm = 0
+        for new_b, lsb in enumerate(positions):
+            if m & lsb:
+                cm |= 1 << new_b
+        out.append((name, cm))
+    return out, (1 << len(positions)) - 1
+
+
+# -----------------------------
+# Greedy set cover
+# -----------------------------
+
+def greedy_cover_indices(masks: Sequence[int], target_mask: int) -> Optional[List[int]]:
+    """
+    Classic greedy set cover: repeatedly take the mask covering the most still-uncovered target bits
+    (first one wins ties).
+
+    Returns indices into masks, in pick order, or None if target_mask can't be covered.
+    """
+    popcount = _popcount
+    remaining = target_mask
+    # gains only shrink as bits get covered, so a mask's last computed gain bounds its current one
+    bound = [popcount(m & target_mask) for m in masks]
+    chosen: List[int] = []
+    while remaining:
+        best_i = None
+        best_gain = 0
+        rem_bits = popcount(remaining)
+        for i, m in enumerate(masks):
+            if bound[i] <= best_gain:
+                # can't beat best_gain (ties go to the earlier index anyway)
+                continue
+            gain = popcount(m & remaining)
+            bound[i] = gain
+            if gain > best_gain:
+                best_gain = gain
+                best_i = i
+                if gain == rem_bits:
+                    # covers everything left; nothing later can beat (or tie ahead of) it
+                    break
+        if best_i is None:
+            return None
+        chosen.append(best_i)
+        remaining &= ~masks[best_i]
+    return chosen
+
+
+def weighted_greedy_cover_indices(masks: Sequence[int], target_mask: int, weights: List[float]) -> Optional[List[int]]:
+    """
+    Same as greedy_cover_indices, but a mask's gain is the summed weight (weights[bit]) of the
+    uncovered target bits it covers.
+    """
+    def mask_weight(cov: int) -> float:
+        w = 0.0
+        while cov:
+            lsb = cov & -cov
+            w += weights[lsb.bit_length() - 1]
+            cov -= lsb
+        return w
+
+    remaining = target_mask
+    # same stale-gain bound as greedy_cover_indices; it skips most of the per-bit weight sums
+    bound = [mask_weight(m & target_mask) for m in masks]
+    chosen: List[int] = []
+    while remaining:
+        best_i = None
+        best_gain = 0.0
+        for i, m in enumerate(masks):
+            if bound[i] <= best_gain:
+                continue
+            cov = m & remaining
+            if cov == remaining:
+                # covers everything left; nothing later can beat (or tie ahead of) it
+                best_i = i
+                break
+            gain = mask_weight(cov)
+            bound[i] = gain
+            if gain > best_gain:
+                best_gain = gain
+                best_i = i
+        if best_i is None:
+            return None
+        chosen.append(best_i)
+        remaining &= ~masks[best_i]
+    return chosen
+
+
+def reweighted_greedy_cover_indices(
+    masks: Sequence[int], target_mask: int, rounds: int = 8, factor: float = 2.0
+) -> Optional[List[int]]:
+    """
+    Iteratively reweighted greedy set cover.
+
+    Round 1 is plain greedy_cover_indices. Each later round multiplies by `factor` the weight of every
+    target bit the previous cover hit exactly once (the bits that pinned a pick in place), then reruns
+    a weighted greedy. Keeps the shortest cover seen, so it is never worse than plain greedy, and on
+    random instances it lands on the optimum far more often. The extra rounds are skipped when the
+    plain greedy cover already meets the ceil(target_bits / max_cover) lower bound.
+
+    Returns indices into masks, or None if target_mask can't be covered.
+    """
+    best = greedy_cover_indices(masks, target_mask)
+    if best is None or len(best) <= 1:
+        return best
+
+    max_cover = max(_popcount(m & target_mask) for m in masks)
+    if len(best) == -(-_popcount(target_mask) // max_cover):
+        # no cover can be shorter
+        return best
+
+    weights = [1.0] * target_mask.bit_length()
+    cover = best
+    for _ in range(rounds - 1):
+        once = 0
+        twice = 0
+        for i in cover:
+            m = masks[i] & target_mask
+            twice |= once & m
+            once |= m
+        mm = once & ~twice
+        while mm:
+            lsb = mm & -mm
+            weights[lsb.bit_length() - 1] *= factor
+            mm -= lsb
+
+        cover = weighted_greedy_cover_indices(masks, target_mask, weights)
+        if cover is None:
+            break
+        if len(cover) < len(best):
+            best = cover
+    return best
+
+
+def solve_set_cover_greedy(villager_masks: List[Tuple[str, int]], target_mask: int) -> Optional[List[str]]:
+    """
+    Greedy (not necessarily minimum) set cover on bitmasks; fast on any input size.
+    Uses the iteratively reweighted greedy, which is never worse than a single greedy pass.
+
+    Returns list of villager names covering target_mask, [] if target_mask == 0, None if impossible.
+    """
+    items = sorted(villager_masks, key=lambda t: _popcount(t[1]), reverse=True)
+    picked = reweighted_greedy_cover_indices([m for _, m in items], target_mask)
+    if picked is None:
+        return None
+    return [items[i][0] for i in picked]
 
 
 # -----------------------------
@@ -238,51 +573,36 @@ def solve_min_set_cover_exact(villager_masks: List[Tuple[str, int]], target_mask
     if target_mask == 0:
         return []
 
-    items = sorted(villager_masks, key=lambda t: t[1].bit_count(), reverse=True)
-
-    # Greedy upper bound for pruning
-    def greedy_upper_bound() -> Optional[List[int]]:
-        remaining = target_mask
-        chosen: List[int] = []
-        while remaining:
-            best_i = None
-            best_gain = 0
-            for i, (_, m) in enumerate(items):
-                gain = (m & remaining).bit_count()
-                if gain > best_gain:
-                    best_gain = gain
-                    best_i = i
-            if best_i is None or best_gain == 0:
-                return None
-            chosen.append(best_i)
-            remaining &= ~items[best_i][1]
-        return chosen
-
-    best_idx = greedy_upper_bound()
-    best_len = len(best_idx) if best_idx else float("inf")
+    items = tuple(sorted(villager_masks, key=lambda t: _popcount(t[1]), reverse=True))
+    # flat masks: one tuple index instead of items[i][1] in the hot loops
+    items_masks = tuple(m for _, m in items)
+
+    # Greedy upper bound for pruning (reweighted: a tighter bound prunes more and short-circuits more often)
+    best_idx = reweighted_greedy_cover_indices(items_masks, target_mask)
+    # int sentinel (no cover needs more than len(items) villagers) keeps every depth compare int-to-int
+    best_len = len(best_idx) if best_idx else len(items) + 1
     best_solution: Optional[List[int]] = best_idx[:] if best_idx else None
 
-    max_cover = max((m.bit_count() for _, m in items), default=0)
+    max_cover = max((_popcount(m) for m in items_masks), default=0)
     if max_cover == 0:
         return None
 
-    bit_to_items: Dict[int, List[int]] = defaultdict(list)
-    for i, (_, m) in enumerate(items):
-        mm = m
-        while mm:
-            lsb = mm & -mm
-            b = lsb.bit_length() - 1
-            bit_to_items[b].append(i)
-            mm -= lsb
+    # No cover can beat ceil(target_bits / max_cover); if greedy already hits that, it is optimal.
+    if best_solution is not None and best_len == -(-_popcount(target_mask) // max_cover):
+        return [items[i][0] for i in best_solution]
 
-    def pick_mrv_bit(remaining: int) -> Optional[int]:
+    bit_to_items = build_bit_to_items(items_masks)
+    # plain list indexed by bit (remaining is always a subset of target_mask)
+    bit_lists: List[List[int]] = [bit_to_items.get(b, []) for b in range(target_mask.bit_length())]
+
+    def pick_mrv_bit(remaining: int, _bits: List[List[int]] = bit_lists) -> Optional[int]:
         mm = remaining
         best_b = None
         best_c = 10**9
         while mm:
             lsb = mm & -mm
             b = lsb.bit_length() - 1
-            c = len(bit_to_items.get(b, []))
+            c = len(_bits[b])
             if c < best_c:
                 best_b, best_c = b, c
                 if c <= 1:
@@ -290,48 +610,63 @@ def solve_min_set_cover_exact(villager_masks: List[Tuple[str, int]], target_mask
             mm -= lsb
         return best_b
 
-    def dfs(chosen: List[int], covered: int) -> None:
+    # current search path: fixed-size typed buffer shared by every dfs frame, chosen[:depth] is live.
+    # A cover never needs more villagers than there are items.
+    chosen = array("i", [-1] * len(items))
+
+    # Everything dfs touches is bound as a default arg so the hot path uses LOAD_FAST, not closure/global loads.
+    def dfs(
+        covered: int,
+        depth: int,
+        _tgt: int = target_mask,
+        _masks: Tuple[int, ...] = items_masks,
+        _bits: List[List[int]] = bit_lists,
+        _pick: Any = pick_mrv_bit,
+        _chosen: Any = chosen,
+        _pop: Any = _popcount,
+    ) -> None:
         nonlocal best_solution, best_len
 
-        if covered == target_mask:
-            if len(chosen) < best_len:
-                best_len = len(chosen)
-                best_solution = chosen[:]
+        if covered == _tgt:
+            if depth < best_len:
+                best_len = depth
+                best_solution = _chosen[:depth].tolist()
             return
 
-        if len(chosen) >= best_len:
+        if depth >= best_len:
             return
 
-        remaining = target_mask & ~covered
-        rem_bits = remaining.bit_count()
+        remaining = _tgt & ~covered
+        rem_bits = _pop(remaining)
 
-        # optimistic lower bound
-        lower = (rem_bits + max_cover - 1) // max_cover
-        if len(chosen) + lower >= best_len:
+        # optimistic lower bound from the best residual coverage of ANY item (shrinks as the search
+        # goes deeper, unlike the global max_cover); the per-item ANDs double as candidate gains.
+        node_gains = [_pop(m & remaining) for m in _masks]
+        residual_max = max(node_gains)
+        if residual_max == 0:
+            return
+        lower = -(-rem_bits // residual_max)
+        if depth + lower >= best_len:
             return
 
-        b = pick_mrv_bit(remaining)
+        b = _pick(remaining)
         if b is None:
             return
 
-        candidates = bit_to_items.get(b, [])
+        candidates = _bits[b]
         if not candidates:
             return
 
-        # try best gain first
-        candidates = sorted(
-            candidates,
-            key=lambda i: (items[i][1] & remaining).bit_count(),
-            reverse=True
-        )
+        # try best gain first; every candidate covers bit b, so gain is always >= 1.
+        # (-gain, i) keeps ties in candidate order, like a stable reverse sort.
+        gains = [(-node_gains[i], i) for i in candidates]
+        gains.sort()
 
-        for i in candidates:
-            new_cov = covered | items[i][1]
-            if new_cov == covered:
-                continue
-            dfs(chosen + [i], new_cov)
+        for _, i in gains:
+            _chosen[depth] = i
+            dfs(covered | _masks[i], depth + 1)
 
-    dfs([], 0)
+    dfs(0, 0)
 
     if best_solution is None:
         return None
@@ -342,80 +677,120 @@ def solve_min_set_cover_exact(villager_masks: List[Tuple[str, int]], target_mask
 # Best-possible under cost==1
 # -----------------------------
 
-def optimize_cost1_best_possible(villagers: Dict[str, Any], required: List[str]) -> Tuple[List[str], Set[str], Set[str]]:
+SOLVERS = {
+    "exact": solve_min_set_cover_exact,
+    "greedy": solve_set_cover_greedy,
+}
+
+
+def optimize_cost1_best_possible(
+    villagers: Dict[str, Any], required: List[str], mode: str = "exact"
+) -> Tuple[List[str], Set[str], Set[str], Dict[str, List[str]]]:
     """
+    mode: "exact" (minimum cover, branch & bound) or "greedy" (fast, may use a few extra villagers)
+
     Returns:
-      solution_names: minimum villagers covering ALL obtainable-at-cost==1 enchants
+      solution_names: minimum villagers covering ALL obtainable-at-cost==1 enchants ("exact" mode)
       obtainable: enchants that exist at cost==1 on at least one villager
       missing: required enchants with no cost==1 source
+      cost1_map: villager_name -> cost==1 required enchants (sorted), reused by reporting
     """
-    req_list, req_index, villager_masks, full_mask = build_cost1_masks(villagers, required)
+    index = build_cost1_masks(villagers, required)
 
     obtainable_mask = 0
-    for _, m in villager_masks:
+    for _, m in index.villager_masks:
         obtainable_mask |= m
 
-    obtainable = {e for e in req_list if (obtainable_mask >> req_index[e]) & 1}
-    missing = set(req_list) - obtainable
+    obtainable = {e for e in index.req_list if (obtainable_mask >> index.req_index[e]) & 1}
+    # dict-keys view difference: one C-level pass, no extra set(req_list)
+    missing = index.req_index.keys() - obtainable
+
+    # Dominated villagers are left out of the search; they show up as extraneous in the report.
+    candidates = prune_dominated_masks(index.villager_masks)
 
-    solution = solve_min_set_cover_exact(villager_masks, obtainable_mask)
-    if solution is None:
-        solution = []
+    # Sole providers are in every cover: take them up front and only search the residual problem.
+    forced, precover, residual = split_forced_villagers(candidates, obtainable_mask)
+    residual, residual_target = compact_masks(residual, obtainable_mask & ~precover)
+    rest = SOLVERS[mode](residual, residual_target)
+    solution = forced + rest if rest is not None else []
 
-    return solution, obtainable, missing
+    return solution, obtainable, missing, index.cost1_map
 
 
 # -----------------------------
 # Reporting
 # -----------------------------
 
-def report_cost1_best_possible(
+def format_cost1_best_possible(
     villagers: Dict[str, Any],
-    required: List[str],
     non_enchants: List[str],
     solution: List[str],
     obtainable: Set[str],
-    missing: Set[str]
-) -> None:
-    required_sorted = sorted(required, key=str.lower)
-
-    print("\n📌 Rule: ONLY cost == 1 trades count.\n")
+    missing: Set[str],
+    cost1_map: Dict[str, List[str]],
+    mode: str = "exact"
+) -> List[str]:
+    """
+    Builds the cost==1 report as a list of output lines (joined with "\n" by the caller).
+    """
+    out: List[str] = ["\n📌 Rule: ONLY cost == 1 trades count.\n"]
 
     if missing:
-        print("❌ Missing (no villager currently offers cost==1 for these goal enchantments):")
+        out.append("❌ Missing (no villager currently offers cost==1 for these goal enchantments):")
         for e in sorted(missing, key=str.lower):
-            print(f" - {e}")
+            out.append(f" - {e}")
     else:
-        print("✅ Nothing missing under cost==1 (full coverage achievable right now).")
+        out.append("✅ Nothing missing under cost==1 (full coverage achievable right now).")
 
-    print("\n✅ Current best set (minimum villagers covering ALL cost==1 obtainable goal enchantments):")
+    if mode == "greedy":
+        out.append("\n✅ Current greedy set (villagers covering ALL cost==1 obtainable goal enchantments; may not be minimal):")
+    else:
+        out.append("\n✅ Current best set (minimum villagers covering ALL cost==1 obtainable goal enchantments):")
     if not solution:
-        print("  (none) — you currently have zero goal enchantments available at cost==1.")
+        out.append("  (none) — you currently have zero goal enchantments available at cost==1.")
     else:
         for i, v in enumerate(solution, 1):
-            covered = [e for e in required_sorted if current_price_for(villagers, v, e) == 1]
-            print(f"{i:>2}. {v}: {', '.join(covered)}")
+            out.append(f"{i:>2}. {v}: {', '.join(cost1_map[v])}")
 
-    # Extraneous villagers
+    # Extraneous villagers (cost1_map is already in case-insensitive name order)
     sol_set = set(solution)
-    extras = sorted(set(villagers.keys()) - sol_set, key=str.lower)
+    extras = [v for v in cost1_map if v not in sol_set]
 
-    print("\n🗑 Extraneous villagers (not needed for best cost==1 coverage):")
+    if mode == "greedy":
+        out.append("\n🗑 Extraneous villagers (not used by the greedy cost==1 set):")
+    else:
+        out.append("\n🗑 Extraneous villagers (not needed for best cost==1 coverage):")
     if not extras:
-        print("  (none)")
+        out.append("  (none)")
     else:
         for v in extras:
-            cost1_goals = [e for e in required_sorted if current_price_for(villagers, v, e) == 1]
+            cost1_goals = cost1_map[v]
             if cost1_goals:
                 # This shouldn't happen if solver is truly minimal, but it can if there are multiple equally-minimal solutions.
-                print(f" - {v}: (has cost==1 goals too) {', '.join(cost1_goals)}")
+                out.append(f" - {v}: (has cost==1 goals too) {', '.join(cost1_goals)}")
             else:
-                print(f" - {v}")
+                out.append(f" - {v}")
 
     # Optional: non-enchantment trades of interest, just echoed for convenience
     if non_enchants:
-        print("\n🧾 Librarian non-enchantments of interest (ignored for optimization):")
-        print(" - " + "\n - ".join(non_enchants))
+        out.append("\n🧾 Librarian non-enchantments of interest (ignored for optimization):")
+        out.append(" - " + "\n - ".join(non_enchants))
+
+    return out
+
+
+def report_cost1_best_possible(
+    villagers: Dict[str, Any],
+    non_enchants: List[str],
+    solution: List[str],
+    obtainable: Set[str],
+    missing: Set[str],
+    cost1_map: Dict[str, List[str]],
+    mode: str = "exact"
+) -> None:
+    out = format_cost1_best_possible(villagers, non_enchants, solution, obtainable, missing, cost1_map, mode)
+    # one write instead of a print() per line
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 # -----------------------------
@@ -432,6 +807,12 @@ def main() -> None:
         default=None,
         help="Path to enchantments.json (default: enchantments.json next to this script)",
     )
+    parser.add_argument(
+        "--mode",
+        choices=sorted(SOLVERS),
+        default="exact",
+        help="exact: minimum villager set (default). greedy: fast cover, may use a few extra villagers.",
+    )
     parser.add_argument(
         "--no-warn-unknown",
         action="store_true",
@@ -452,18 +833,21 @@ def main() -> None:
         print(f"❌ Missing enchantments file: {ench_path}")
         sys.exit(1)
 
-    villagers = load_villagers(villagers_path)
-    required, non_enchants = load_master_enchantments(ench_path)
-
-    required_set = set(required)
-    non_set = set(non_enchants)
+    try:
+        villagers = load_villagers(villagers_path)
+        required, non_enchants = load_master_enchantments(ench_path)
+    except ValueError as e:
+        # validation errors (and malformed JSON) from either loader: one line, no traceback
+        print(f"❌ {e}")
+        sys.exit(1)
 
     if not args.no_warn_unknown:
-        warn_unknown_keys(villagers, required_set, non_set)
+        # one frozenset straight from both lists, rather than two sets plus their union
+        warn_unknown_keys(villagers, frozenset(chain(required, non_enchants)))
 
-    solution, obtainable, missing = optimize_cost1_best_possible(villagers, required)
+    solution, obtainable, missing, cost1_map = optimize_cost1_best_possible(villagers, required, args.mode)
 
-    report_cost1_best_possible(villagers, required, non_enchants, solution, obtainable, missing)
+    report_cost1_best_possible(villagers, non_enchants, solution, obtainable, missing, cost1_map, args.mode)
 
 
 if __name__ == "__main__":